@@ -1,6 +1,7 @@
 # app/api/routers/job_offers.py
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
 from sqlalchemy.orm import Session
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -16,6 +17,16 @@ from services.storage import minio_service
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Flow is built once; the extracted text is passed as a per-run tweak
+summary_flow = langflow_client.flow(
+    settings.LANGFLOW_CANDIDATE_SUMMARY_GENERATION_FLOW_ID,
+    tweaks={
+        "Agent-gE9mt": {},
+        "Prompt-kPUCU": {},
+        "TextOutput-riQeq": {}
+    }
+)
+
 @router.post("/", status_code=status.HTTP_201_CREATED, 
            responses={
                201: {"description": "Candidate created successfully"},
@@ -37,22 +48,6 @@ async def create_candidate(
         # Upload document to MinIO
         object_name = await minio_service.upload_file(document, minio_service.candidates_bucket_name)
         logger.info(f"Document uploaded to MinIO with object name: {object_name}")
-        
-        # Reset file position
-        await document.seek(0)
-
-        # Create a summary flow
-        summary_flow = langflow_client.flow(
-            settings.LANGFLOW_CANDIDATE_SUMMARY_GENERATION_FLOW_ID,
-            tweaks={
-            "Agent-gE9mt": {},
-            "TextInput-cTRS8": {
-                "input_value": extracted_text
-            },
-            "Prompt-kPUCU": {},
-            "TextOutput-riQeq": {}
-                }
-        )
 
         # # Create a skills extraction flow
         # skills_extraction_flow = langflow_client.flow(
@@ -72,6 +67,10 @@ async def create_candidate(
         summary_result = await summary_flow.run({
             "output_type": "text",
             "input_type": "text"
+        }, tweaks={
+            "TextInput-cTRS8": {
+                "input_value": extracted_text
+            }
         })
 
         # # Run the flow to get skills
@@ -92,7 +91,9 @@ async def create_candidate(
             "storage_url": object_name
         }
         
-        candidate = candidate_repository.create(db, obj_in=CandidateCreate(**candidate_data))
+        candidate = await asyncio.to_thread(
+            candidate_repository.create, db, obj_in=CandidateCreate(**candidate_data)
+        )
 
         # skills = parse_skills_response(skills_text)
         # job_offer_skill_repository.bulk_create(db=db, job_offer_id=job_offer.id, skills=skills)
@@ -106,7 +107,7 @@ async def create_candidate(
     except Exception as e:
         # If any error occurs, clean up if needed
         if 'job_offer' in locals():
-            candidate_repository.remove(db, id=candidate.id)
+            await asyncio.to_thread(candidate_repository.remove, db, id=candidate.id)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
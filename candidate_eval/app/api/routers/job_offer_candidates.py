@@ -1,9 +1,10 @@
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps import get_db, get_current_active_user
-from app.db.models import User
+from app.db.models import Candidate, JobOfferCandidate, User
 from app.schemas.candidate import JobOfferCandidateCreate, JobOfferCandidateDetail, CandidateCreate
 from app.repositories.candidate import job_offer_candidate_repository, candidate_repository
 from app.repositories.job_offer import job_offer_repository
@@ -14,6 +15,16 @@ from app.services.matching import matching_service
 router = APIRouter(prefix="/job-offers/{job_offer_id}/candidates", tags=["Job Offer Candidates"])
 
 
+def _get_job_offer_candidate_detail(db: Session, job_offer_candidate_id: int) -> JobOfferCandidate:
+    """Load a job offer candidate link with its candidate and skills for serialization"""
+    return (
+        db.query(JobOfferCandidate)
+        .options(selectinload(JobOfferCandidate.candidate).selectinload(Candidate.skills))
+        .filter(JobOfferCandidate.id == job_offer_candidate_id)
+        .one()
+    )
+
+
 @router.get("/", response_model=List[JobOfferCandidateDetail])
 async def get_job_offer_candidates(
     job_offer_id: int,
@@ -97,11 +108,7 @@ async def add_candidate_to_job_offer(
     )
     
     # Return full detail
-    result = db.query(JobOfferCandidateDetail).filter(
-        JobOfferCandidateDetail.id == job_offer_candidate.id
-    ).first()
-    
-    return result
+    return _get_job_offer_candidate_detail(db, job_offer_candidate.id)
 
 
 @router.put("/{candidate_id}", response_model=JobOfferCandidateDetail)
@@ -126,34 +133,34 @@ async def link_candidate_to_job_offer(
     
     # Check if already linked
     existing = (
-        db.query(JobOfferCandidateDetail)
+        db.query(JobOfferCandidate)
+        .options(selectinload(JobOfferCandidate.candidate).selectinload(Candidate.skills))
         .filter(
-            JobOfferCandidateDetail.job_offer_id == job_offer_id,
-            JobOfferCandidateDetail.candidate_id == candidate_id
+            JobOfferCandidate.job_offer_id == job_offer_id,
+            JobOfferCandidate.candidate_id == candidate_id
         )
         .first()
     )
     
+    # Calculate match score once for both the update and the new link paths
+    fit_score = await matching_service.match_candidate_to_job(
+        db=db, job_offer_id=job_offer_id, candidate_id=candidate_id
+    )
+    
     if existing:
-        # Recalculate match score
-        fit_score = await matching_service.match_candidate_to_job(
-            db=db, job_offer_id=job_offer_id, candidate_id=candidate_id
-        )
-        
         # Update score if changed
         if existing.fit_score != fit_score:
-            existing.fit_score = fit_score
-            db.add(existing)
+            db.execute(
+                update(JobOfferCandidate)
+                .where(JobOfferCandidate.id == existing.id)
+                .values(fit_score=fit_score)
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
-            db.refresh(existing)
+            existing.fit_score = fit_score
             
         return existing
     
-    # Calculate match score
-    fit_score = await matching_service.match_candidate_to_job(
-        db=db, job_offer_id=job_offer_id, candidate_id=candidate_id
-    )
-    
     # Link candidate to job offer
     job_offer_candidate_in = JobOfferCandidateCreate(
         job_offer_id=job_offer_id,
@@ -166,13 +173,7 @@ async def link_candidate_to_job_offer(
     )
     
     # Return full detail
-    result = (
-        db.query(JobOfferCandidateDetail)
-        .filter(JobOfferCandidateDetail.id == job_offer_candidate.id)
-        .first()
-    )
-    
-    return result
+    return _get_job_offer_candidate_detail(db, job_offer_candidate.id)
 
 
 @router.delete("/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT)
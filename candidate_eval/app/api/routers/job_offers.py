@@ -1,35 +1,37 @@
 # app/api/routers/job_offers.py
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, status
 from sqlalchemy.orm import Session
+import asyncio
 import logging
 from typing import List, Optional
 
 from core.database import get_db
-from utils.document_utils import process_document
-from utils.langflow_utils import parse_skills_response
-from services.langflow_client import langflow_client
-from core.config import settings
+from utils.document_utils import ALLOWED_STORED_FILE_TYPES, process_document
 from repositories.job_offer import job_offer_repository
-from repositories.job_offer_skill import job_offer_skill_repository
 from schemas.job_offer import JobOfferCreate, JobOfferUpdate, JobOfferWithSkills, JobOfferInDB
 from services.storage import minio_service
+from services.job_offer_processing import process_job_offer
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/", status_code=status.HTTP_201_CREATED, 
+@router.post("/", status_code=status.HTTP_202_ACCEPTED, 
            responses={
-               201: {"description": "Job offer created successfully"},
+               202: {"description": "Job offer created, summary and skills are being generated"},
                400: {"description": "Invalid request", "model": dict},
                500: {"description": "Server error", "model": dict}
            })
 async def create_job_offer(
+    background_tasks: BackgroundTasks,
     title: str = Form(..., description="Job offer title"),
     document: UploadFile = File(..., description="Job offer description document"),
     db: Session = Depends(get_db)
 ):
     """
     Create a new job offer with required document upload.
+    
+    The summary and skills are generated in the background; poll
+    GET /job-offers/{id} until its status is "completed" or "failed".
     """
     
     try:
@@ -39,75 +41,28 @@ async def create_job_offer(
         # Upload document to MinIO
         object_name = await minio_service.upload_file(document, minio_service.job_offers_bucket_name)
         logger.info(f"Document uploaded to MinIO with object name: {object_name}")
-        
-        # Reset file position
-        await document.seek(0)
-
-        # Create a summary flow
-        summary_flow = langflow_client.flow(
-            settings.LANGFLOW_SUMMARY_GENERATION_FLOW_ID,
-            tweaks={
-                "Agent-gE9mt": {},
-                "TextOutput-riQeq": {},
-                "TextInput-cTRS8": {
-                    "input_value": extracted_text
-                },
-                "Prompt-kPUCU": {}
-            }
-        )
-
-        # Create a skills extraction flow
-        skills_extraction_flow = langflow_client.flow(
-            settings.LANGFLOW_SKILLS_EXTRACTION_FLOW_ID,
-            tweaks={
-                "Agent-tFpjL": {},
-                "TextOutput-9JOx7": {},
-                "TextInput-ZLrFC": {
-                    "input_value": extracted_text
-                },
-                "Prompt-NCiV2": {}
-            }
-        )
-
-        # Run the flow to get summary
-        logger.info(f"Calling LangFlow summary API with flow ID: {settings.LANGFLOW_SUMMARY_GENERATION_FLOW_ID}")
-        summary_result = await summary_flow.run({
-            "output_type": "text",
-            "input_type": "text"
-        })
 
-        # Run the flow to get skills
-        logger.info(f"Calling LangFlow skills API with flow ID: {settings.LANGFLOW_SKILLS_EXTRACTION_FLOW_ID}")
-        skills_result = await skills_extraction_flow.run({
-            "output_type": "text",
-            "input_type": "text"
-        })
-
-        summary_text = summary_result["outputs"][0]["outputs"][0]["results"]["text"]["data"]["text"]
-        skills_text = skills_result["outputs"][0]["outputs"][0]["results"]["text"]["data"]["text"]
-        logger.info(f"Summary and skills extracted from langflow return")
-        
-        # Create the job offer with generated summary
+        # Create the job offer; summary and skills are generated in the background
         job_offer_data = {
             "title": title,
-            "summary": summary_text,
             "storage_url": object_name,
+            "status": "processing",
         }
         
-        job_offer = job_offer_repository.create(db, obj_in=JobOfferCreate(**job_offer_data))
+        job_offer = await asyncio.to_thread(
+            job_offer_repository.create, db, obj_in=JobOfferCreate(**job_offer_data)
+        )
 
-        skills = parse_skills_response(skills_text)
-        job_offer_skill_repository.bulk_create(db=db, job_offer_id=job_offer.id, skills=skills)
+        background_tasks.add_task(process_job_offer, job_offer.id, extracted_text)
 
         return {"id": job_offer.id, 
             "title": job_offer.title,
-            "summary": summary_text,
-            "skills": skills_text
+            "status": job_offer.status
         }
     except Exception as e:
         # If any error occurs, clean up if needed
         if 'job_offer' in locals():
-            job_offer_repository.remove(db, id=job_offer.id)
+            await asyncio.to_thread(job_offer_repository.remove, db, id=job_offer.id)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -127,7 +82,7 @@ def read_job_offers(
     """
     if title:
         # Filter by title
-        return job_offer_repository.get_by_title(db, title=title)
+        return job_offer_repository.get_by_title(db, title=title, skip=skip, limit=limit)
     else:
         # Get all
         return job_offer_repository.get_multi(db, skip=skip, limit=limit)
@@ -164,7 +119,7 @@ async def update_job_offer(
     - replace_file: Whether to replace existing file (true) or keep it (false)
     """
     # Check if job offer exists
-    job_offer = job_offer_repository.get(db, id=job_offer_id)
+    job_offer = await asyncio.to_thread(job_offer_repository.get, db, id=job_offer_id)
     if not job_offer:
         raise HTTPException(
             status_code=404,
@@ -180,44 +135,32 @@ async def update_job_offer(
     
     # Update the basic job offer information
     if update_data:
-        job_offer = job_offer_repository.update(
-            db, db_obj=job_offer, obj_in=JobOfferUpdate(**update_data)
+        job_offer = await asyncio.to_thread(
+            job_offer_repository.update, db, db_obj=job_offer, obj_in=JobOfferUpdate(**update_data)
         )
     
     # Handle file upload if a new file is provided
     if file and file.filename:
         # Validate file type
-        allowed_types = [
-            "application/pdf", 
-            "application/msword", 
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "text/plain",
-            "application/vnd.ms-excel",
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        ]
-        
-        if file.content_type not in allowed_types:
+        if file.content_type not in ALLOWED_STORED_FILE_TYPES:
             raise HTTPException(
                 status_code=400,
                 detail="File must be a PDF, Word document, text file, or Excel spreadsheet"
             )
         
         try:
-            # Check if there's an existing file to delete
+            # Delete the existing file; failures are logged and don't block the upload
             if replace_file and job_offer.storage_url:
-                try:
-                    # Try to delete the existing file
-                    minio_service.client.remove_object(minio_service.bucket_name, job_offer.storage_url)
-                except Exception as e:
-                    # Log but continue
-                    print(f"Error deleting existing file: {e}")
+                await asyncio.to_thread(
+                    minio_service.remove_file, job_offer.storage_url, minio_service.job_offers_bucket_name
+                )
             
             # Upload the new file
-            object_name = await minio_service.upload_file(file)
+            object_name = await minio_service.upload_file(file, minio_service.job_offers_bucket_name)
             
             # Update the job offer with the new storage URL
-            job_offer = job_offer_repository.update_storage_url(
-                db, job_offer_id=job_offer_id, storage_url=object_name
+            job_offer = await asyncio.to_thread(
+                job_offer_repository.update_storage_url, db, job_offer_id=job_offer_id, storage_url=object_name
             )
         except Exception as e:
             raise HTTPException(
@@ -240,12 +183,8 @@ def delete_job_offer(
             detail="Job offer not found"
         )
     
-    # Delete file from minio is there is one
+    # Delete file from minio if there is one; failures are logged and don't block the delete
     if job_offer.storage_url:
-        try:
-            minio_service.client.remove_object(minio_service.bucket_name, job_offer.storage_url)
-        except Exception as e:
-            # Log the error but continue with deleting the database entry
-            print(f"Error deleting file from MinIO: {e}")
+        minio_service.remove_file(job_offer.storage_url, minio_service.job_offers_bucket_name)
     
     return job_offer_repository.remove(db, id=job_offer_id)
@@ -1,18 +1,35 @@
 # app/db/models.py
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, create_engine, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, create_engine, DateTime, DDL, Index, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# The title trigram index needs pg_trgm; create it before create_all builds the tables
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 class JobOffer(Base):
     __tablename__ = 'job_offers'
+    __table_args__ = (
+        # Serves the ILIKE '%...%' substring search in get_by_title
+        Index(
+            'ix_job_offers_title_trgm',
+            'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'}
+        ),
+    )
     
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     summary = Column(Text)
     storage_url = Column(String(255))
+    status = Column(String(50), nullable=False, server_default='completed')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -23,7 +40,7 @@ class JobOfferSkill(Base):
     __tablename__ = 'job_offers_skills'
     
     id = Column(Integer, primary_key=True)
-    job_offer_id = Column(Integer, ForeignKey('job_offers.id', ondelete='CASCADE'))
+    job_offer_id = Column(Integer, ForeignKey('job_offers.id', ondelete='CASCADE'), index=True)
     skill = Column(String(255), nullable=False)
     expertise_level = Column(String(50))
     priority = Column(String(50))
@@ -45,7 +62,7 @@ class CandidateSkill(Base):
     __tablename__ = 'candidate_skills'
     
     id = Column(Integer, primary_key=True)
-    job_candidate_id = Column(Integer, ForeignKey('candidates.id', ondelete='CASCADE'))
+    job_candidate_id = Column(Integer, ForeignKey('candidates.id', ondelete='CASCADE'), index=True)
     type = Column(String(50))
     name = Column(String(255), nullable=False)
     expertise_level = Column(String(50))
@@ -56,8 +73,8 @@ class JobOfferCandidate(Base):
     __tablename__ = 'job_offer_candidates'
     
     id = Column(Integer, primary_key=True)
-    candidate_id = Column(Integer, ForeignKey('candidates.id', ondelete='CASCADE'))
-    job_offer_id = Column(Integer, ForeignKey('job_offers.id', ondelete='CASCADE'))
+    candidate_id = Column(Integer, ForeignKey('candidates.id', ondelete='CASCADE'), index=True)
+    job_offer_id = Column(Integer, ForeignKey('job_offers.id', ondelete='CASCADE'), index=True)
     fit_score = Column(Float)
     
     candidate = relationship("Candidate", back_populates="job_offers")
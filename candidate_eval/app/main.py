@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 import uvicorn
 
@@ -8,6 +9,7 @@ from api.routers import job_offers, candidates
 from db.models import Base
 from core.database import engine
 from services.storage import minio_service
+from services.langflow_client import langflow_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,14 +20,6 @@ logger.info("Creating database tables...")
 Base.metadata.create_all(bind=engine)
 logger.info("Database tables created successfully.")
 
-# Ensure MinIO bucket exists
-logger.info("Ensuring MinIO buckets exists...")
-try:
-    minio_service._ensure_bucket_exists()
-    logger.info("MinIO bucket setup complete.")
-except Exception as e:
-    logger.error(f"Error setting up MinIO bucket: {e}")
-
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json"
@@ -52,6 +46,20 @@ app.include_router(
     tags=["candidates"]
 )
 
+@app.on_event("startup")
+async def ensure_minio_buckets():
+    # Ensure MinIO buckets exist; the minio SDK is blocking, so run it in a worker thread
+    logger.info("Ensuring MinIO buckets exists...")
+    try:
+        await asyncio.to_thread(minio_service._ensure_bucket_exists)
+        logger.info("MinIO bucket setup complete.")
+    except Exception as e:
+        logger.error(f"Error setting up MinIO bucket: {e}")
+
+@app.on_event("shutdown")
+async def close_langflow_client():
+    await langflow_client.aclose()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to the Recruitment System API"}
@@ -0,0 +1,43 @@
+"""add trigram index on job offer title
+
+Revision ID: c7a19e05b3d2
+Revises: 8f2c4d6a1e93
+Create Date: 2026-10-15 11:03:47.215630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a19e05b3d2'
+down_revision: Union[str, None] = '8f2c4d6a1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.drop_index('ix_job_offers_title_lower', table_name='job_offers')
+    op.create_index(
+        'ix_job_offers_title_trgm',
+        'job_offers',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_offers_title_trgm', table_name='job_offers')
+    op.create_index(
+        'ix_job_offers_title_lower',
+        'job_offers',
+        [sa.text('lower(title) text_pattern_ops')],
+        unique=False
+    )
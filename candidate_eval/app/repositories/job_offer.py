@@ -1,18 +1,19 @@
 # app/repositories/job_offer.py
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc
 
 from db.models import JobOffer, JobOfferSkill
 from schemas.job_offer import JobOfferCreate, JobOfferUpdate
 from repositories.base import BaseRepository
+from repositories.job_offer_skill import job_offer_skill_repository
 
 class JobOfferRepository(BaseRepository[JobOffer, JobOfferCreate, JobOfferUpdate]):
-    def get_by_title(self, db: Session, *, title: str) -> List[JobOffer]:
-        """Get job offers by title (partial match)"""
+    def get_by_title(self, db: Session, *, title: str, skip: int = 0, limit: int = 100) -> List[JobOffer]:
+        """Get job offers by title (case-insensitive partial match)"""
         return db.query(JobOffer).filter(
-            func.lower(JobOffer.title).contains(func.lower(title))
-        ).all()
+            JobOffer.title.ilike(f"%{title}%")
+        ).offset(skip).limit(limit).all()
     
     def get_recent(self, db: Session, *, limit: int = 10) -> List[JobOffer]:
         """Get the most recently created job offers"""
@@ -57,8 +58,28 @@ class JobOfferRepository(BaseRepository[JobOffer, JobOfferCreate, JobOfferUpdate
             db.delete(skill)
             db.commit()
             
+    def complete_processing(
+        self, db: Session, *, job_offer_id: int, obj_in: Dict[str, Any], skills: List[dict]
+    ) -> Optional[JobOffer]:
+        """
+        Update a job offer and add its skills in a single transaction, so readers
+        never see the new status without its skills
+        """
+        job_offer = self.get(db, id=job_offer_id)
+        if job_offer:
+            for field, value in obj_in.items():
+                setattr(job_offer, field, value)
+            db.add(job_offer)
+            job_offer_skill_repository.bulk_create(
+                db, job_offer_id=job_offer_id, skills=skills, commit=False
+            )
+            db.commit()
+        return job_offer
+            
     def get_with_skills(self, db: Session, *, job_offer_id: int) -> Optional[JobOffer]:
         """Get a job offer with all its skills"""
-        return db.query(JobOffer).filter(JobOffer.id == job_offer_id).first()
+        return db.query(JobOffer).options(
+            selectinload(JobOffer.skills)
+        ).filter(JobOffer.id == job_offer_id).first()
 
 job_offer_repository = JobOfferRepository(JobOffer)
\ No newline at end of file
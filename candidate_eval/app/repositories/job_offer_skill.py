@@ -1,5 +1,6 @@
 # app/repositories/job_offer_skill.py
 from typing import List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from db.models import JobOfferSkill
@@ -15,23 +16,19 @@ class JobOfferSkillRepository(BaseRepository[JobOfferSkill, JobOfferSkillCreate,
         """Get all job offers that require a specific skill"""
         return db.query(JobOfferSkill).filter(JobOfferSkill.skill == skill).all()
     
-    def bulk_create(self, db: Session, *, job_offer_id: int, skills: List[dict]) -> List[JobOfferSkill]:
-        """Create multiple skills for a job offer in one operation"""
-        db_skills = []
-        for skill_data in skills:
-            db_skill = JobOfferSkill(
-                job_offer_id=job_offer_id,
-                skill=str(skill_data["skill"]),
-                expertise_level=str(skill_data["expertise_level"]),
-                priority=str(skill_data["priority"])
-            )
-            db.add(db_skill)
-            db_skills.append(db_skill)
+    def bulk_create(self, db: Session, *, job_offer_id: int, skills: List[dict], commit: bool = True) -> List[JobOfferSkill]:
+        """
+        Create multiple skills for a job offer in one INSERT ... RETURNING round trip.
+        Pass commit=False to leave the insert in the caller's transaction.
+        """
+        rows = [{"job_offer_id": job_offer_id, **skill_data} for skill_data in skills]
+        if not rows:
+            return []
         
-        db.commit()
-        for skill in db_skills:
-            db.refresh(skill)
+        db_skills = db.scalars(insert(JobOfferSkill).returning(JobOfferSkill), rows).all()
+        if commit:
+            db.commit()
         
-        return db_skills
+        return list(db_skills)
 
 job_offer_skill_repository = JobOfferSkillRepository(JobOfferSkill)
\ No newline at end of file
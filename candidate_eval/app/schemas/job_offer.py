@@ -1,15 +1,27 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, field_validator
+from typing import Any, Optional, List
 from datetime import datetime
 
 class JobOfferSkillBase(BaseModel):
     skill: str
-    expertise_level: Optional[int] = None
+    expertise_level: Optional[str] = None
     priority: Optional[str] = None
+    
+    @field_validator("skill", "expertise_level", "priority", mode="before")
+    @classmethod
+    def coerce_scalars_to_str(cls, value: Any) -> Any:
+        """LLM output may use numbers or booleans for these fields; store them as text"""
+        if isinstance(value, (bool, int, float)):
+            return str(value)
+        return value
 
 class JobOfferSkillCreate(JobOfferSkillBase):
     pass
 
+class JobOfferSkillsExtraction(BaseModel):
+    """Skills payload returned by the LangFlow skills extraction flow; items are validated one by one"""
+    skills: List[Any] = []
+
 class JobOfferSkill(JobOfferSkillBase):
     id: int
     job_offer_id: int
@@ -24,12 +36,13 @@ class JobOfferBase(BaseModel):
     storage_url: Optional[str] = None
 
 class JobOfferCreate(JobOfferBase):
-    pass
+    status: str = "processing"
 
 class JobOfferUpdate(BaseModel):
     title: Optional[str] = None
     summary: Optional[str] = None
     storage_url: Optional[str] = None
+    status: Optional[str] = None
 
 class JobOfferSkillUpdate(BaseModel):
     skill: Optional[str] = None
@@ -38,6 +51,7 @@ class JobOfferSkillUpdate(BaseModel):
 
 class JobOfferInDB(JobOfferBase):
     id: int
+    status: str
     created_at: datetime
     updated_at: Optional[datetime] = None
     
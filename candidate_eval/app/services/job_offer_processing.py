@@ -0,0 +1,83 @@
+# app/services/job_offer_processing.py
+import asyncio
+import logging
+
+from core.config import settings
+from core.database import SessionLocal
+from repositories.job_offer import job_offer_repository
+from services.langflow_client import langflow_client
+from utils.langflow_utils import parse_skills_response
+
+logger = logging.getLogger(__name__)
+
+# Flows are built once; the extracted text is passed as a per-run tweak
+summary_flow = langflow_client.flow(
+    settings.LANGFLOW_SUMMARY_GENERATION_FLOW_ID,
+    tweaks={
+        "Agent-gE9mt": {},
+        "TextOutput-riQeq": {},
+        "Prompt-kPUCU": {}
+    }
+)
+
+skills_extraction_flow = langflow_client.flow(
+    settings.LANGFLOW_SKILLS_EXTRACTION_FLOW_ID,
+    tweaks={
+        "Agent-tFpjL": {},
+        "TextOutput-9JOx7": {},
+        "Prompt-NCiV2": {}
+    }
+)
+
+async def _run_flow(flow, input_node_id: str, extracted_text: str) -> dict:
+    """Run a text flow on the extracted text; the client caps concurrent LangFlow requests."""
+    return await flow.run({
+        "output_type": "text",
+        "input_type": "text"
+    }, tweaks={
+        input_node_id: {
+            "input_value": extracted_text
+        }
+    })
+
+def _store_results(job_offer_id: int, obj_in: dict, skills: list) -> None:
+    """Store the processing results using a session owned by the background task."""
+    db = SessionLocal()
+    try:
+        job_offer = job_offer_repository.complete_processing(
+            db, job_offer_id=job_offer_id, obj_in=obj_in, skills=skills
+        )
+        if not job_offer:
+            logger.warning(f"Job offer {job_offer_id} was deleted before processing finished")
+    finally:
+        db.close()
+
+async def process_job_offer(job_offer_id: int, extracted_text: str) -> None:
+    """
+    Generate the summary and skills of a job offer with LangFlow and store them.
+
+    Runs as a background task after the job offer row has been created with
+    status "processing"; the row ends up "completed" or "failed".
+    """
+    try:
+        logger.info(f"Calling LangFlow summary API with flow ID: {settings.LANGFLOW_SUMMARY_GENERATION_FLOW_ID}")
+        logger.info(f"Calling LangFlow skills API with flow ID: {settings.LANGFLOW_SKILLS_EXTRACTION_FLOW_ID}")
+        summary_result, skills_result = await asyncio.gather(
+            _run_flow(summary_flow, "TextInput-cTRS8", extracted_text),
+            _run_flow(skills_extraction_flow, "TextInput-ZLrFC", extracted_text)
+        )
+
+        summary_text = summary_result["outputs"][0]["outputs"][0]["results"]["text"]["data"]["text"]
+        skills_text = skills_result["outputs"][0]["outputs"][0]["results"]["text"]["data"]["text"]
+        logger.info(f"Summary and skills extracted from langflow return for job offer {job_offer_id}")
+
+        skills = parse_skills_response(skills_text)
+        await asyncio.to_thread(
+            _store_results, job_offer_id, {"summary": summary_text, "status": "completed"}, skills
+        )
+    except Exception as e:
+        logger.error(f"Error processing job offer {job_offer_id}: {e}")
+        try:
+            await asyncio.to_thread(_store_results, job_offer_id, {"status": "failed"}, [])
+        except Exception as e:
+            logger.error(f"Error marking job offer {job_offer_id} as failed: {e}")
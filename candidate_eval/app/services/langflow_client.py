@@ -1,18 +1,23 @@
 # app/services/langflow_client.py
 import httpx
-import json
 import logging
 import platform
 import asyncio
 import io
 import PyPDF2
-from typing import Dict, Any, Optional, List, Union, Callable, TypeVar, Generic
+from typing import Dict, Any, AsyncIterator, Optional, List, Union, Callable, TypeVar, Generic
 from pydantic import BaseModel
 from enum import Enum
 import sys
 from dataclasses import dataclass
 from core.config import settings
 
+# orjson is optional; it decodes responses noticeably faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 # Similar to the TypeScript error classes
@@ -37,6 +42,7 @@ class LangflowClientOptions:
     timeout: Optional[float] = None
     default_headers: Optional[Dict[str, str]] = None
     http_client: Optional[httpx.AsyncClient] = None
+    max_concurrent_requests: Optional[int] = None
 
 @dataclass
 class RequestOptions:
@@ -59,31 +65,30 @@ class Flow:
         self.flow_id = flow_id
         self.tweaks = tweaks or {}
     
-    async def run(self, inputs: Optional[Dict[str, Any]] = None, stream: bool = False):
-        """Run the flow with the given inputs."""
+    async def run(self, inputs: Optional[Dict[str, Any]] = None, stream: bool = False, tweaks: Optional[Tweaks] = None):
+        """Run the flow with the given inputs, merging per-run tweaks over the flow's own."""
         payload = {
-            "tweaks": self.tweaks,
+            "tweaks": {**self.tweaks, **tweaks} if tweaks else self.tweaks,
         }
         
         if inputs:
             payload.update(inputs)
             
-        headers = {"Content-Type": "application/json"}
+        # httpx sets Content-Type: application/json for JSON bodies
         path = f"/run/{self.flow_id}"
         
         if stream:
-            return await self.client.stream(RequestOptions(
+            # Async generator of decoded events; iterate it with `async for`
+            return self.client.stream(RequestOptions(
                 path=path,
                 method="POST",
-                body=payload,
-                headers=headers
+                body=payload
             ))
         else:
             return await self.client.request(RequestOptions(
                 path=path,
                 method="POST",
-                body=payload,
-                headers=headers
+                body=payload
             ))
 
 # Main client class
@@ -96,16 +101,33 @@ class LangflowClient:
             
         self.base_url = settings.LANGFLOW_API_URL
         self.base_path = "/api/v1"
+        self.api_url = f"{self.base_url}{self.base_path}"
         self.api_key = opts.api_key or settings.LANGFLOW_API_KEY
         self.timeout = opts.timeout or settings.LANGFLOW_TIMEOUT or 60.0
         self.default_headers = opts.default_headers or {}
+        self.max_concurrent_requests = opts.max_concurrent_requests or settings.LANGFLOW_MAX_CONCURRENT_REQUESTS
+        
+        # Caps how many requests, from any flow, are in flight at the same time
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
         # Set User-Agent if not provided
         if "User-Agent" not in self.default_headers:
             self.default_headers["User-Agent"] = self._get_user_agent()
+        
+        # Set API key if available
+        if self.api_key:
+            self._set_api_key(self.api_key, self.default_headers)
             
-        # HTTP client
-        self.http_client = opts.http_client
+        # HTTP client, shared across requests so connections are kept alive and reused.
+        # Default headers live on the client, so requests only pass their own extra headers.
+        self.http_client = opts.http_client or httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent_requests,
+                max_keepalive_connections=self.max_concurrent_requests
+            )
+        )
+        self.http_client.headers.update(self.default_headers)
     
     def _get_user_agent(self) -> str:
         """Get User-Agent string."""
@@ -115,116 +137,100 @@ class LangflowClient:
         """Set API key in headers."""
         headers["x-api-key"] = api_key
     
-    def _set_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
-        """Set default headers."""
-        # Combine default headers with provided headers
-        combined_headers = {**self.default_headers}
-        
-        if headers:
-            for key, value in headers.items():
-                combined_headers[key] = value
-                
-        # Set API key if available
-        if self.api_key:
-            self._set_api_key(self.api_key, combined_headers)
-            
-        return combined_headers
-    
     def flow(self, flow_id: str, tweaks: Optional[Tweaks] = None) -> Flow:
         """Create a Flow instance."""
         return Flow(self, flow_id, tweaks)
     
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.http_client.aclose()
+    
     async def request(self, options: RequestOptions) -> Any:
         """Make a request to the Langflow API."""
         path, method = options.path, options.method
         body = options.body
-        headers = self._set_headers(options.headers or {})
+        headers = options.headers
         timeout = options.timeout or self.timeout
         
-        url = f"{self.base_url}{self.base_path}{path}"
+        url = self.api_url + path
         
-        async with (self.http_client or httpx.AsyncClient(timeout=timeout)) as client:
-            try:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers)
-                else:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        json=body,
-                        headers=headers
-                    )
-                
-                if not response.is_success:
-                    raise LangflowError(
-                        f"{response.status_code} - {response.reason_phrase}",
-                        response
-                    )
-                
-                return response.json()
-                
-            except httpx.TimeoutException as e:
-                raise LangflowRequestError(f"Request timed out after {timeout}s", e)
-            except httpx.RequestError as e:
-                raise LangflowRequestError(f"Request failed: {str(e)}", e)
-            except LangflowError:
-                raise
-            except Exception as e:
-                raise LangflowRequestError(f"Unexpected error: {str(e)}", e)
+        # GET requests never carry a body
+        if method.upper() == "GET":
+            body = None
+        
+        try:
+            async with self._semaphore:
+                response = await self.http_client.request(
+                    method=method,
+                    url=url,
+                    json=body,
+                    headers=headers,
+                    timeout=timeout
+                )
+            
+            if not response.is_success:
+                raise LangflowError(
+                    f"{response.status_code} - {response.reason_phrase}",
+                    response
+                )
+            
+            return json_loads(response.content)
+            
+        except httpx.TimeoutException as e:
+            raise LangflowRequestError(f"Request timed out after {timeout}s", e)
+        except httpx.RequestError as e:
+            raise LangflowRequestError(f"Request failed: {str(e)}", e)
+        except LangflowError:
+            raise
+        except Exception as e:
+            raise LangflowRequestError(f"Unexpected error: {str(e)}", e)
     
-    async def stream(self, options: RequestOptions) -> Any:
-        """Stream a response from the Langflow API."""
+    async def stream(self, options: RequestOptions) -> AsyncIterator[Any]:
+        """Stream a response from the Langflow API, yielding one decoded event per line."""
         path, method = options.path, options.method
         body = options.body
-        headers = self._set_headers(options.headers or {})
+        headers = options.headers
         timeout = options.timeout or self.timeout
         
-        url = f"{self.base_url}{self.base_path}{path}"
+        url = self.api_url + path
         
-        # Add streaming parameter
-        if "?" in url:
-            url += "&stream=true"
-        else:
-            url += "?stream=true"
-        
-        async with (self.http_client or httpx.AsyncClient(timeout=timeout)) as client:
-            try:
-                response = await client.stream(
+        try:
+            # The request slot is held until the stream is fully consumed
+            async with self._semaphore:
+                # The response must stay open while its lines are consumed
+                async with self.http_client.stream(
                     method=method,
                     url=url,
+                    params={"stream": "true"},
                     json=body,
-                    headers=headers
-                )
-                
-                if not response.is_success:
-                    error_text = ""
-                    async for chunk in response.aiter_text():
-                        error_text += chunk
+                    headers=headers,
+                    timeout=timeout
+                ) as response:
+                    if not response.is_success:
+                        error_text = ""
+                        async for chunk in response.aiter_text():
+                            error_text += chunk
                     
-                    raise LangflowError(
-                        f"{response.status_code} - {response.reason_phrase}: {error_text}",
-                        response
-                    )
+                        raise LangflowError(
+                            f"{response.status_code} - {response.reason_phrase}: {error_text}",
+                            response
+                        )
                 
-                # Return async generator for streaming
-                async def stream_response():
                     async for line in response.aiter_lines():
                         if line.strip():
                             try:
-                                yield json.loads(line)
-                            except json.JSONDecodeError:
+                                yield json_loads(line)
+                            except ValueError:
                                 logger.warning(f"Failed to decode JSON from stream: {line}")
-                
-                return stream_response()
-                
-            except httpx.TimeoutException as e:
-                raise LangflowRequestError(f"Stream request timed out after {timeout}s", e)
-            except httpx.RequestError as e:
-                raise LangflowRequestError(f"Stream request failed: {str(e)}", e)
-            except LangflowError:
-                raise
-            except Exception as e:
-                raise LangflowRequestError(f"Unexpected stream error: {str(e)}", e)
+            
+        except httpx.TimeoutException as e:
+            raise LangflowRequestError(f"Stream request timed out after {timeout}s", e)
+        except httpx.RequestError as e:
+            raise LangflowRequestError(f"Stream request failed: {str(e)}", e)
+        except LangflowError:
+            raise
+        except Exception as e:
+            raise LangflowRequestError(f"Unexpected stream error: {str(e)}", e)
     
 # Singleton instance 
 langflow_client = LangflowClient(
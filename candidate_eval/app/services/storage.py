@@ -1,16 +1,26 @@
 from minio import Minio
 from minio.error import S3Error
-import os
+from urllib3.exceptions import HTTPError
 from fastapi import UploadFile
-import io
+import asyncio
 from core.config import settings
+from utils.document_utils import get_document_size
 import uuid
 import logging
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Uploads larger than this are sent to MinIO as multipart chunks of this size
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+# S3 error codes worth retrying; anything else (NoSuchKey, AccessDenied...) won't change on a retry
+RETRYABLE_S3_ERROR_CODES = frozenset({"InternalError", "ServiceUnavailable", "SlowDown", "RequestTimeout"})
+# Seconds to wait before retrying a failed removal
+REMOVE_RETRY_DELAY = 0.5
+
 class MinioService:
     def __init__(self):
         self.client = Minio(
@@ -21,16 +31,21 @@ class MinioService:
         )
         self.job_offers_bucket_name = settings.MINIO_JOB_OFFERS_BUCKET_NAME
         self.candidates_bucket_name = settings.MINIO_CANDIDATES_BUCKET_NAME
+        # Buckets already confirmed to exist, so repeated checks skip the round trip
+        self._known_buckets = set()
     
     def _ensure_bucket_exists(self):
         """Ensure the bucket exists, create it if it doesn't"""
         for bucket_name in [self.job_offers_bucket_name, self.candidates_bucket_name]:
+            if bucket_name in self._known_buckets:
+                continue
             try:
                 if not self.client.bucket_exists(bucket_name):
                     self.client.make_bucket(bucket_name)
                     logger.info(f"Bucket '{bucket_name}' created successfully")
                 else: 
                     logger.info(f"Bucket '{bucket_name}' already exists")
+                self._known_buckets.add(bucket_name)
             except S3Error as e:
                 logger.error(f"Error ensuring bucket exists: {e}")
     
@@ -38,38 +53,69 @@ class MinioService:
         """Upload a file to MinIO and return its path"""
         try:
             # Generate a unique filename
-            file_extension = os.path.splitext(file.filename)[1] if file.filename else ''
-            object_name = f"{uuid.uuid4()}{file_extension}"
+            filename = file.filename or ''
+            dot = filename.rfind('.')
+            file_extension = filename[dot:] if dot > filename.rfind('/') + 1 else ''
+            object_name = f"{uuid.uuid4().hex}{file_extension}"
             
-            # Read the file content
-            file_content = await file.read()
-            file_size = len(file_content)
+            # Stream from the underlying spooled file instead of reading it into memory
+            file_size = get_document_size(file)
+            file.file.seek(0)
             
-            # Upload to MinIO
-            self.client.put_object(
+            # Upload to MinIO without blocking the event loop
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=bucket_name,
                 object_name=object_name,
-                data=io.BytesIO(file_content),
+                data=file.file,
                 length=file_size,
-                content_type=file.content_type
+                content_type=file.content_type,
+                part_size=UPLOAD_PART_SIZE
             )
             
             return object_name
         except S3Error as e:
-            print(f"Error uploading file: {e}")
+            logger.error("Error uploading file: %s", e)
             raise
 
-    def get_file_url(self, object_name: str) -> str:
+    async def get_file_url(self, object_name: str, bucket_name: str) -> str:
         """Get a presigned URL for accessing a file"""
         try:
-            url = self.client.presigned_get_object(
-                bucket_name=self.bucket_name,
+            url = await asyncio.to_thread(
+                self.client.presigned_get_object,
+                bucket_name=bucket_name,
                 object_name=object_name,
             )
             return url
         except S3Error as e:
-            print(f"Error getting file URL: {e}")
+            logger.error("Error getting file URL: %s", e)
             raise
 
+    def remove_file(self, object_name: str, bucket_name: str) -> bool:
+        """
+        Remove a file from MinIO, retrying once after a short delay on transient
+        errors; failures are logged and reported as False
+        """
+        for attempt in range(1, 3):
+            try:
+                self.client.remove_object(bucket_name, object_name)
+                return True
+            except S3Error as e:
+                logger.warning(
+                    "Error removing '%s' from bucket '%s' (attempt %d): %s",
+                    object_name, bucket_name, attempt, e
+                )
+                if e.code not in RETRYABLE_S3_ERROR_CODES:
+                    return False
+            except HTTPError as e:
+                # Connection and timeout errors raised by minio's urllib3 pool
+                logger.warning(
+                    "Error removing '%s' from bucket '%s' (attempt %d): %s",
+                    object_name, bucket_name, attempt, e
+                )
+            if attempt == 1:
+                time.sleep(REMOVE_RETRY_DELAY)
+        return False
+
 # Initialize the MinIO service
 minio_service = MinioService()
\ No newline at end of file
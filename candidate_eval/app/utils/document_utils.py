@@ -3,18 +3,41 @@ import io
 import PyPDF2
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException, status, UploadFile
-from typing import List, Tuple, Optional
+from typing import BinaryIO, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# pypdfium2 (PDFium bindings) is optional; it extracts text much faster than pure-Python PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# charset_normalizer is optional; it detects the encoding of non UTF-8 text files
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+# PDFium is not thread-safe, so extractions run one at a time on a dedicated thread,
+# away from the default executor used by the database and storage offloads
+_pdfium_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdfium")
+
 # Define allowed document types
-ALLOWED_DOCUMENT_TYPES = [
+ALLOWED_DOCUMENT_TYPES = frozenset({
     "application/pdf", 
     "application/msword", 
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "text/plain",
-]
+})
+
+# Types accepted when a job offer's stored file is replaced; Excel files are stored but not parsed
+ALLOWED_STORED_FILE_TYPES = ALLOWED_DOCUMENT_TYPES | {
+    "application/vnd.ms-excel",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
 
 class DocumentProcessingError(Exception):
     """Exception raised for errors in document processing."""
@@ -36,6 +59,60 @@ async def validate_document_type(document: UploadFile) -> None:
             detail={"error": "File must be a PDF, Word document or a text file"}
         )
 
+def get_document_size(document: UploadFile) -> int:
+    """
+    Get the size of an uploaded document without reading its content.
+    
+    Args:
+        document: The uploaded file to measure
+    
+    Returns:
+        Size of the document in bytes
+    """
+    if document.size is not None:
+        return document.size
+    
+    position = document.file.tell()
+    size = document.file.seek(0, io.SEEK_END)
+    document.file.seek(position)
+    return size
+
+def _extract_pdf_pages_pdfium(pdf_stream: BinaryIO) -> str:
+    """Extract the text of every page of a PDF stream with PDFium, joined with newlines."""
+    pdf = pdfium.PdfDocument(pdf_stream)
+    try:
+        return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+def _extract_pdf_pages_pypdf2(pdf_stream: BinaryIO) -> str:
+    """Extract the text of every page of a PDF stream with PyPDF2, joined with newlines."""
+    # Use PyPDF2 to extract text straight from the spooled upload, without a bytes copy
+    pdf_reader = PyPDF2.PdfReader(pdf_stream)
+    return "\n".join(page.extract_text() or "" for page in pdf_reader.pages)
+
+def decode_text(content: bytes) -> str:
+    """
+    Decode the content of a text file.
+    
+    Tries UTF-8 first, then the encoding detected by charset_normalizer when it
+    is installed, and finally UTF-8 with undecodable bytes replaced.
+    
+    Args:
+        content: The raw bytes of the text file
+    
+    Returns:
+        The decoded text
+    """
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        if from_bytes is not None:
+            best_match = from_bytes(content).best()
+            if best_match is not None:
+                return str(best_match)
+        return content.decode('utf-8', errors='replace')
+
 async def extract_text_from_pdf(pdf_file: UploadFile) -> str:
     """
     Extract text from a PDF file.
@@ -50,28 +127,54 @@ async def extract_text_from_pdf(pdf_file: UploadFile) -> str:
         DocumentProcessingError: If text extraction fails
     """
     try:
-        # Read file content
-        await pdf_file.seek(0)  # Reset file position
-        content = await pdf_file.read()
+        # Reset file position
+        await pdf_file.seek(0)
         
-        # Use PyPDF2 to extract text
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-        text = ""
-        
-        # Process in chunks to prevent memory issues
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text += page.extract_text() + "\n"
-            
-            # Allow other async tasks to run
-            if page_num % 5 == 0:
-                await asyncio.sleep(0)
-        
-        return text
+        # Parsing is CPU-bound, so run it in a worker thread to keep the event loop free
+        if pdfium is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_pdfium_executor, _extract_pdf_pages_pdfium, pdf_file.file)
+        return await asyncio.to_thread(_extract_pdf_pages_pypdf2, pdf_file.file)
     except Exception as e:
         logger.error(f"Error extracting text from PDF: {str(e)}")
         raise DocumentProcessingError(f"Error extracting text from PDF: {str(e)}")
 
+async def extract_text_from_word(document: UploadFile) -> str:
+    """
+    Extract text from a Word document.
+    
+    Args:
+        document: The Word document to extract text from
+    
+    Returns:
+        A description of the document, as Word parsing is not supported yet
+    """
+    # You can add Word document extraction here if needed
+    # For now, we only report the size, which doesn't need the body
+    return f"Document content (binary): {get_document_size(document)} bytes"
+
+async def extract_text_from_plain_text(document: UploadFile) -> str:
+    """
+    Extract text from a plain text file.
+    
+    Args:
+        document: The text file to extract text from
+    
+    Returns:
+        The decoded content of the file
+    """
+    await document.seek(0)
+    content = await document.read()
+    return decode_text(content)
+
+# Text extractors keyed by the exact MIME types accepted by validate_document_type
+TEXT_EXTRACTORS = {
+    "application/pdf": extract_text_from_pdf,
+    "application/msword": extract_text_from_word,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": extract_text_from_word,
+    "text/plain": extract_text_from_plain_text,
+}
+
 async def extract_text_from_document(document: UploadFile) -> str:
     """
     Extract text from a document based on its content type.
@@ -86,24 +189,10 @@ async def extract_text_from_document(document: UploadFile) -> str:
         DocumentProcessingError: If text extraction fails
     """
     try:
-        content_type = document.content_type.lower()
-        
-        if "pdf" in content_type:
-            return await extract_text_from_pdf(document)
-        elif "docx" in content_type or "doc" in content_type or "word" in content_type:
-            # You can add Word document extraction here if needed
-            # For now, we'll read raw content and convert to string
-            await document.seek(0)
-            content = await document.read()
-            return f"Document content (binary): {len(content)} bytes"
-        elif "text/plain" in content_type:
-            await document.seek(0)
-            content = await document.read()
-            return content.decode('utf-8')
-        else:
-            await document.seek(0)
-            content = await document.read()
-            return f"Unknown document type: {content_type}, size: {len(content)} bytes"
+        extractor = TEXT_EXTRACTORS.get(document.content_type)
+        if extractor is not None:
+            return await extractor(document)
+        return f"Unknown document type: {document.content_type}, size: {get_document_size(document)} bytes"
     except Exception as e:
         logger.error(f"Error extracting text from document: {str(e)}")
         raise DocumentProcessingError(f"Error extracting text from document: {str(e)}")
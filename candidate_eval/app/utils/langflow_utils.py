@@ -1,29 +1,49 @@
 # app/utils/langflow_utils.py
-import json
+import logging
 import re
 from typing import List, Dict, Any
+from pydantic import ValidationError
+
+from schemas.job_offer import JobOfferSkillCreate, JobOfferSkillsExtraction
+
+logger = logging.getLogger(__name__)
+
+# Matches a ```json fenced block in free-form LLM output
+JSON_FENCE_PATTERN = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+def _validate_skills(skills_json: str) -> List[Dict[str, Any]]:
+    """
+    Parse a skills JSON document and validate each skill on its own, so one
+    malformed entry only drops that entry.
+    """
+    extraction = JobOfferSkillsExtraction.model_validate_json(skills_json)
+    skills = []
+    for index, item in enumerate(extraction.skills):
+        try:
+            skills.append(JobOfferSkillCreate.model_validate(item).model_dump())
+        except ValidationError as e:
+            logger.warning("Skipping invalid skill %d in LangFlow response: %s", index, e)
+    return skills
 
 def parse_skills_response(skills_text: str) -> List[Dict[str, Any]]:
     """
     Parse the skills text response from LangFlow into structured data.
-    The expected format is a JSON string with skills array.
+    The expected format is a JSON string with skills array; each skill is
+    validated against JobOfferSkillCreate.
     """
     try:
         # Try to parse as JSON directly
-        data = json.loads(skills_text)
-        if isinstance(data, dict) and "skills" in data:
-            return data["skills"]
-    except json.JSONDecodeError:
-        # If direct JSON parsing fails, try to extract JSON from text
-        json_pattern = r'```json\s*(.*?)\s*```'
-        match = re.search(json_pattern, skills_text, re.DOTALL)
+        return _validate_skills(skills_text)
+    except ValidationError as e:
+        error = e
+        # If direct JSON parsing fails, try to extract JSON from a fenced block
+        match = JSON_FENCE_PATTERN.search(skills_text) if '```' in skills_text else None
         if match:
             try:
-                data = json.loads(match.group(1))
-                if isinstance(data, dict) and "skills" in data:
-                    return data["skills"]
-            except json.JSONDecodeError:
-                pass
+                return _validate_skills(match.group(1))
+            except ValidationError as e:
+                error = e
     
     # If all parsing attempts fail, return empty list
-    return []
\ No newline at end of file
+    logger.warning("Could not parse skills from LangFlow response: %s", error)
+    return []